@@ -4,11 +4,11 @@
  */
 
 const path = require("path");
-const inquirer = require("inquirer");
 const chalk = require("chalk");
 const CommandRegistry = require("./src/commands");
 const AIEngine = require("./src/core/ai-engine");
 const ConfigManager = require("./src/core/config-manager");
+const { findCaseDirectory, stripCasePrefix } = require("./src/utils/case_utils");
 
 // 案件类型导入
 const CivilCase = require("./src/case-types/civil");
@@ -16,6 +16,43 @@ const CriminalCase = require("./src/case-types/criminal");
 const AdministrativeCase = require("./src/case-types/administrative");
 const NonLitigationCase = require("./src/case-types/non-litigation");
 
+// 案件类型到实现类的映射（导入时解析一次）
+const CASE_CLASSES = {
+  "民商事": CivilCase,
+  "刑事": CriminalCase,
+  "行政": AdministrativeCase,
+  "非诉": NonLitigationCase
+};
+
+// CDT优化：简化命令映射（模块级常量，避免每次输入都重建）
+const COMMAND_MAP = {
+  // 简化的中文短命令
+  新案件: "create_case", 新建案件: "create_case", 创建案件: "create_case",
+  看案件: "list_cases", 案件列表: "list_cases",
+  选案件: "switch_case", 选择案件: "switch_case", 切换案件: "switch_case",
+  加材料: "add_material", 添加材料: "add_material",
+  找焦点: "analyze_case", 识别争议焦点: "analyze_case", 争议焦点: "analyze_case",
+  定策略: "litigation_strategy", 诉讼策略: "litigation_strategy", 制定诉讼策略: "litigation_strategy"
+};
+
+// 固定别名集合（Set成员判断为O(1)，避免每次输入重建比较链）
+const HELP_ALIASES = new Set(["help", "帮助", "?"]);
+const DETAILED_HELP_ALIASES = new Set(["详助", "详细帮助"]);
+const EXIT_ALIASES = new Set(["exit", "退出", "quit"]);
+const CASE_TYPES = new Set(Object.keys(CASE_CLASSES));
+
+// 争议焦点/诉讼策略快捷命令统一查表调度（命令 → 目标命令及前置参数）
+const FOCUS_DISPATCH = { name: "analyze_case", prefixArgs: ["识别争议焦点"] };
+const STRATEGY_DISPATCH = { name: "litigation_strategy", prefixArgs: [] };
+const SPECIAL_COMMANDS = new Map([
+  ["找焦点", FOCUS_DISPATCH],
+  ["识别争议焦点", FOCUS_DISPATCH],
+  ["争议焦点", FOCUS_DISPATCH],
+  ["定策略", STRATEGY_DISPATCH],
+  ["诉讼策略", STRATEGY_DISPATCH],
+  ["制定诉讼策略", STRATEGY_DISPATCH],
+]);
+
 // 初始化核心组件
 const commandRegistry = new CommandRegistry();
 const aiEngine = new AIEngine();
@@ -30,22 +67,42 @@ function showWelcomeMessage() {
   console.log();
 }
 
+// CDT优化：帮助文本在模块加载时生成一次，输出时只需一次write
+const HELP_TEXT = [
+  chalk.magenta('📁 基础操作'),
+  chalk.white('  • ') + chalk.cyan('新案件') + chalk.gray('  - 创建新案件 (新案件：名称 类型)'),
+  chalk.white('  • ') + chalk.cyan('看案件') + chalk.gray('  - 查看所有案件'),
+  chalk.white('  • ') + chalk.cyan('选案件') + chalk.gray('  - 切换案件 (选案件：名称)'),
+  chalk.magenta('🔍 案件分析'),
+  chalk.white('  • ') + chalk.cyan('加材料') + chalk.gray('  - 添加案件材料 (加材料：名称 内容)'),
+  chalk.white('  • ') + chalk.cyan('找焦点') + chalk.gray('  - 识别争议焦点 (找焦点：案件名)'),
+  chalk.white('  • ') + chalk.cyan('定策略') + chalk.gray('  - 制定诉讼策略 (定策略：案件名)'),
+  chalk.magenta('⚙️  系统'),
+  chalk.white('  • ') + chalk.cyan('帮助') + chalk.gray('    - 显示详细帮助'),
+  chalk.white('  • ') + chalk.yellow('Ctrl+C') + chalk.gray(' - 快速退出'),
+].join('\n');
+
+const DETAILED_HELP_TEXT = [
+  chalk.blue.bold('\n详细帮助指南'),
+  chalk.gray('━'.repeat(40)),
+  chalk.yellow('\n基础操作：'),
+  '  新案件：合同纠纷 民商事',
+  '  看案件',
+  '  选案件：合同纠纷',
+  chalk.yellow('\n案件分析：'),
+  '  加材料：起诉状 原告张三...',
+  '  找焦点：合同纠纷',
+  '  定策略：合同纠纷',
+  chalk.yellow('\n快捷键：'),
+  '  Ctrl+C - 退出系统',
+  '  帮助 - 显示基础帮助',
+  '  详助 - 显示详细帮助',
+].join('\n');
+
 // CDT优化：简化命令结构，渐进式信息披露
 function showHelpMessage(context = null) {
-  console.log(chalk.magenta('📁 基础操作'));
-  console.log(chalk.white('  • ') + chalk.cyan('新案件') + chalk.gray('  - 创建新案件 (新案件：名称 类型)'));
-  console.log(chalk.white('  • ') + chalk.cyan('看案件') + chalk.gray('  - 查看所有案件'));
-  console.log(chalk.white('  • ') + chalk.cyan('选案件') + chalk.gray('  - 切换案件 (选案件：名称)'));
-  
-  console.log(chalk.magenta('🔍 案件分析'));
-  console.log(chalk.white('  • ') + chalk.cyan('加材料') + chalk.gray('  - 添加案件材料 (加材料：名称 内容)'));
-  console.log(chalk.white('  • ') + chalk.cyan('找焦点') + chalk.gray('  - 识别争议焦点 (找焦点：案件名)'));
-  console.log(chalk.white('  • ') + chalk.cyan('定策略') + chalk.gray('  - 制定诉讼策略 (定策略：案件名)'));
-  
-  console.log(chalk.magenta('⚙️  系统'));
-  console.log(chalk.white('  • ') + chalk.cyan('帮助') + chalk.gray('    - 显示详细帮助'));
-  console.log(chalk.white('  • ') + chalk.yellow('Ctrl+C') + chalk.gray(' - 快速退出'));
-  
+  console.log(HELP_TEXT);
+
   // CDT优化：上下文智能提示
   const tip = getContextualTip(context);
   if (tip) {
@@ -69,23 +126,7 @@ function getContextualTip(context) {
 }
 
 function showDetailedHelp() {
-  console.log(chalk.blue.bold('\n详细帮助指南'));
-  console.log(chalk.gray('━'.repeat(40)));
-  
-  console.log(chalk.yellow('\n基础操作：'));
-  console.log('  新案件：合同纠纷 民商事');
-  console.log('  看案件');
-  console.log('  选案件：合同纠纷');
-  
-  console.log(chalk.yellow('\n案件分析：'));
-  console.log('  加材料：起诉状 原告张三...');
-  console.log('  找焦点：合同纠纷');
-  console.log('  定策略：合同纠纷');
-  
-  console.log(chalk.yellow('\n快捷键：'));
-  console.log('  Ctrl+C - 退出系统');
-  console.log('  帮助 - 显示基础帮助');
-  console.log('  详助 - 显示详细帮助');
+  console.log(DETAILED_HELP_TEXT);
 }
 
 // CDT优化：错误预防与智能建议
@@ -105,18 +146,22 @@ function validateCommand(command, args, context) {
 
 async function processCommand(input, context) {
   try {
-    const lowerInput = input.trim().toLowerCase();
-    if (lowerInput === "help" || lowerInput === "帮助" || lowerInput === "?") {
+    const trimmed = input.trim();
+    // ASCII快速路径：中文命令无需toLowerCase，跳过一次字符串分配
+    const lowerInput =
+      trimmed && trimmed.charCodeAt(0) < 128 ? trimmed.toLowerCase() : trimmed;
+
+    if (HELP_ALIASES.has(lowerInput)) {
       showHelpMessage(context);
       return "";
     }
 
-    if (lowerInput === "详助" || lowerInput === "详细帮助") {
+    if (DETAILED_HELP_ALIASES.has(lowerInput)) {
       showDetailedHelp();
       return "";
     }
 
-    if (lowerInput === "exit" || lowerInput === "退出" || lowerInput === "quit") {
+    if (EXIT_ALIASES.has(lowerInput)) {
       console.log(chalk.green("👋 感谢使用法律工程系统，再见！"));
       process.exit(0);
     }
@@ -138,45 +183,30 @@ async function processCommand(input, context) {
       args = parts.slice(1);
     }
 
-    // CDT优化：简化命令映射
-    const commandMap = {
-      // 简化的中文短命令
-      新案件: "create_case", 新建案件: "create_case", 创建案件: "create_case",
-      看案件: "list_cases", 案件列表: "list_cases",
-      选案件: "switch_case", 选择案件: "switch_case", 切换案件: "switch_case",
-      加材料: "add_material", 添加材料: "add_material",
-      找焦点: "analyze_case", 识别争议焦点: "analyze_case", 争议焦点: "analyze_case",
-      定策略: "litigation_strategy", 诉讼策略: "litigation_strategy", 制定诉讼策略: "litigation_strategy"
-    };
-
     // CDT优化：错误预防
     const warnings = validateCommand(command, args, context);
     if (warnings.length > 0) {
       return warnings.join('\n') + '\n\n' + getContextualTip(context);
     }
 
-    // 特殊处理争议焦点命令
-    if (command === "找焦点" || command === "识别争议焦点" || command === "争议焦点") {
-      // 如果没有参数且有当前案件，使用当前案件
-      if (args.length === 0 && context.currentCase) {
-        args = [context.currentCase.caseName];
-      }
-      return await commandRegistry.executeCommand("analyze_case", ["识别争议焦点", ...args], context);
-    }
-
-    // 特殊处理策略命令
-    if (command === "定策略" || command === "诉讼策略" || command === "制定诉讼策略") {
+    // 特殊处理争议焦点/策略快捷命令：一次查表代替逐命令if分支
+    const special = SPECIAL_COMMANDS.get(command);
+    if (special) {
       // 如果没有参数且有当前案件，使用当前案件
       if (args.length === 0 && context.currentCase) {
         args = [context.currentCase.caseName];
       }
-      return await commandRegistry.executeCommand("litigation_strategy", args, context);
+      return await commandRegistry.executeCommand(
+        special.name,
+        [...special.prefixArgs, ...args],
+        context
+      );
     }
 
-    const cmdName = commandMap[command] || command;
+    const cmdName = COMMAND_MAP[command] || command;
 
     if (!commandRegistry.commands.has(cmdName)) {
-      const suggestions = getSimilarCommands(command, Object.keys(commandMap));
+      const suggestions = getSimilarCommands(command, Object.keys(COMMAND_MAP));
       if (suggestions.length > 0) {
         return `未找到命令: ${command}\n💡 您是否想要执行: ${suggestions.join(", ")}\n\n输入 "帮助" 查看可用命令`;
       }
@@ -247,12 +277,11 @@ function getLevenshteinDistance(str1, str2) {
 
 function splitArgsSmartly(input) {
   if (!input.includes(" ")) return [input];
-  
-  const caseTypes = ["民商事", "刑事", "行政", "非诉"];
+
   const words = input.split(" ");
   const lastWord = words[words.length - 1];
 
-  if (caseTypes.includes(lastWord)) {
+  if (CASE_TYPES.has(lastWord)) {
     return [words.slice(0, -1).join(" "), lastWord];
   }
 
@@ -263,6 +292,9 @@ function splitArgsSmartly(input) {
 }
 
 async function startInteractiveMode(context) {
+  // 延迟加载inquirer：单次命令行调用不进入交互模式，无需承担其启动开销
+  const inquirer = require("inquirer");
+
   showWelcomeMessage();
 
   // 设置快捷键支持
@@ -303,14 +335,7 @@ async function startInteractiveMode(context) {
 }
 
 function createCaseObject(caseInfo, actualCaseName) {
-  const caseClasses = {
-    "民商事": CivilCase,
-    "刑事": CriminalCase,
-    "行政": AdministrativeCase,
-    "非诉": NonLitigationCase
-  };
-  
-  const CaseClass = caseClasses[caseInfo.type] || CivilCase;
+  const CaseClass = CASE_CLASSES[caseInfo.type] || CivilCase;
   return new CaseClass(caseInfo.id, actualCaseName, caseInfo.type, caseInfo.businessType);
 }
 
@@ -342,34 +367,43 @@ async function start() {
           
           try {
             const casesDir = path.join(process.cwd(), "cases");
-            if (!fs.existsSync(casesDir)) return [];
-
-            return fs.readdirSync(casesDir)
-              .filter(name => {
-                const fullPath = path.join(casesDir, name);
-                return fs.statSync(fullPath).isDirectory() && 
-                       name !== "案件模板" && !name.startsWith(".");
-              })
-              .map(name => {
-                const caseName = name.startsWith("案件：") ? name.replace(/^案件：/, "") : name;
-                const caseInfoPath = path.join(casesDir, name, "案件信息.json");
-                
-                try {
-                  if (fs.existsSync(caseInfoPath)) {
-                    const caseInfo = JSON.parse(fs.readFileSync(caseInfoPath, "utf8"));
-                    return {
-                      id: caseInfo.id || "unknown",
-                      name: caseName,
-                      type: caseInfo.type || "未知",
-                      businessType: caseInfo.businessType || "",
-                      createTime: caseInfo.createTime || "",
-                      status: caseInfo.status || "进行中",
-                    };
-                  }
-                } catch (e) {}
-                
-                return { id: "unknown", name: caseName, type: "未知" };
-              });
+
+            // 单次readdir带类型信息，无需逐项statSync（目录不存在时捕获ENOENT）
+            let entries;
+            try {
+              entries = fs.readdirSync(casesDir, { withFileTypes: true });
+            } catch (e) {
+              return [];
+            }
+
+            const cases = [];
+            for (const entry of entries) {
+              if (!entry.isDirectory() ||
+                  entry.name === "案件模板" ||
+                  entry.name.startsWith(".")) {
+                continue;
+              }
+
+              const caseName = stripCasePrefix(entry.name);
+              const caseInfoPath = path.join(casesDir, entry.name, "案件信息.json");
+
+              // 直接读取案件信息文件，缺失或损坏时退回占位信息
+              try {
+                const caseInfo = JSON.parse(fs.readFileSync(caseInfoPath, "utf8"));
+                cases.push({
+                  id: caseInfo.id || "unknown",
+                  name: caseName,
+                  type: caseInfo.type || "未知",
+                  businessType: caseInfo.businessType || "",
+                  createTime: caseInfo.createTime || "",
+                  status: caseInfo.status || "进行中",
+                });
+              } catch (e) {
+                cases.push({ id: "unknown", name: caseName, type: "未知" });
+              }
+            }
+
+            return cases;
           } catch (err) {
             console.error("获取案件列表出错:", err);
             return [];
@@ -386,12 +420,8 @@ async function start() {
               throw new Error(`案例目录不存在: ${casesDir}`);
             }
 
-            const allDirs = fs.readdirSync(casesDir);
-            let foundCaseDir = allDirs.find(dir => 
-              dir === caseName || dir === `案件：${caseName}` ||
-              dir.includes(caseName) || 
-              (dir.startsWith("案件：") && dir.substring(3).includes(caseName))
-            );
+            // 复用共享的目录匹配逻辑（完全匹配优先，避免部分匹配抢先命中）
+            const foundCaseDir = findCaseDirectory(casesDir, caseName);
 
             if (!foundCaseDir) {
               throw new Error(`找不到案件: ${caseName}`);
@@ -400,12 +430,12 @@ async function start() {
             const caseFolderPath = path.join(casesDir, foundCaseDir);
             const caseInfoPath = path.join(caseFolderPath, "案件信息.json");
             
+            const actualCaseName = stripCasePrefix(foundCaseDir);
+
             let caseInfo;
             if (fs.existsSync(caseInfoPath)) {
               caseInfo = JSON.parse(fs.readFileSync(caseInfoPath, "utf8"));
             } else {
-              const actualCaseName = foundCaseDir.startsWith("案件：") 
-                ? foundCaseDir.substring(3) : foundCaseDir;
               caseInfo = {
                 id: "temp-" + Date.now(),
                 name: actualCaseName,
@@ -416,9 +446,6 @@ async function start() {
               };
             }
 
-            const actualCaseName = foundCaseDir.startsWith("案件：") 
-              ? foundCaseDir.substring(3) : foundCaseDir;
-            
             const caseObject = createCaseObject(caseInfo, actualCaseName);
             context.currentCase = caseObject;
 
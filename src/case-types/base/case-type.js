@@ -61,13 +61,15 @@ class CaseType {
    */
   addMaterial(materialName, materialContent, materialType = "其他材料") {
     try {
-      const materialId = Date.now().toString();
+      // 统一取一次时间，材料ID与创建时间保持一致
+      const now = new Date();
+      const materialId = now.getTime().toString();
       const materialObj = {
         id: materialId,
         name: materialName,
         content: materialContent,
         type: materialType,
-        createdAt: new Date().toISOString(),
+        createdAt: now.toISOString(),
       };
 
       // 添加到材料列表
@@ -166,12 +168,13 @@ class CaseType {
       if (fs.existsSync(infoPath)) {
         return JSON.parse(fs.readFileSync(infoPath, "utf-8"));
       } else {
+        const nowIso = new Date().toISOString();
         const defaultInfo = {
           caseId: this.caseId,
           caseName: this.caseName,
           caseType: this.caseType,
-          createdAt: new Date().toISOString(),
-          updatedAt: new Date().toISOString(),
+          createdAt: nowIso,
+          updatedAt: nowIso,
           parties: {
             plaintiffs: [],
             defendants: [],
@@ -251,11 +254,14 @@ class CaseType {
    */
   saveAnalysisResult(analysisType, result) {
     try {
+      // 统一取一次时间，结果记录与文件名时间戳保持一致
+      const nowIso = new Date().toISOString();
+
       // 添加到分析结果
       this.analysisResults[analysisType] = {
         type: analysisType,
         result: result,
-        createdAt: new Date().toISOString(),
+        createdAt: nowIso,
       };
 
       // 保存到新版目录
@@ -288,7 +294,7 @@ class CaseType {
         }
 
         // 保存为Markdown文件
-        const timestamp = new Date().toISOString().replace(/[:.]/g, "-");
+        const timestamp = nowIso.replace(/[:.]/g, "-");
         const mdFilePath = path.join(
           analysisDir,
           `${analysisType}-${timestamp}.md`
@@ -345,41 +351,52 @@ class CaseType {
       // 首先尝试从新版目录获取
       if (fs.existsSync(this.caseFolderPath)) {
         const analysisDir = path.join(this.caseFolderPath, "分析");
-        if (fs.existsSync(analysisDir)) {
-          // 遍历所有子目录
-          const subDirs = ["争议焦点", "诉讼策略", "风险评估", "法律意见"];
-          for (const subDir of subDirs) {
-            const subDirPath = path.join(analysisDir, subDir);
-            if (fs.existsSync(subDirPath)) {
-              const files = fs.readdirSync(subDirPath);
-              // 查找匹配的分析文件
-              const matchingFile = files.find((file) =>
-                file.startsWith(analysisType)
-              );
-              if (matchingFile) {
-                const filePath = path.join(subDirPath, matchingFile);
-                const content = fs.readFileSync(filePath, "utf-8");
-                this.analysisResults[analysisType] = {
-                  type: analysisType,
-                  result: content,
-                  createdAt: new Date().toISOString(),
-                };
-                return content;
-              }
-            }
+        // 遍历所有子目录
+        const subDirs = ["争议焦点", "诉讼策略", "风险评估", "法律意见"];
+        for (const subDir of subDirs) {
+          const subDirPath = path.join(analysisDir, subDir);
+
+          // 直接读取目录并捕获ENOENT，存在性检查与枚举合并为一次系统调用
+          let files;
+          try {
+            files = fs.readdirSync(subDirPath);
+          } catch (e) {
+            continue; // 该子目录不存在
+          }
+
+          // 查找匹配的分析文件
+          const matchingFile = files.find((file) =>
+            file.startsWith(analysisType)
+          );
+          if (matchingFile) {
+            const filePath = path.join(subDirPath, matchingFile);
+            const content = fs.readFileSync(filePath, "utf-8");
+            this.analysisResults[analysisType] = {
+              type: analysisType,
+              result: content,
+              createdAt: new Date().toISOString(),
+            };
+            return content;
           }
         }
       }
 
-      // 然后尝试从旧版目录获取
+      // 然后尝试从旧版目录获取（同样直接读取并捕获ENOENT）
       const resultPath = path.join(
         this.caseDataDir,
         "analysis",
         `${analysisType}.json`
       );
 
-      if (fs.existsSync(resultPath)) {
-        const resultData = JSON.parse(fs.readFileSync(resultPath, "utf-8"));
+      let rawResult = null;
+      try {
+        rawResult = fs.readFileSync(resultPath, "utf-8");
+      } catch (e) {
+        // 旧版结果文件不存在
+      }
+
+      if (rawResult !== null) {
+        const resultData = JSON.parse(rawResult);
         this.analysisResults[analysisType] = resultData;
         return resultData.result;
       }
@@ -400,39 +417,69 @@ class CaseType {
       // 首先尝试从新版目录获取
       if (fs.existsSync(this.caseFolderPath)) {
         const analysisDir = path.join(this.caseFolderPath, "分析");
-        if (fs.existsSync(analysisDir)) {
-          // 遍历所有子目录
-          const subDirs = ["争议焦点", "诉讼策略", "风险评估", "法律意见"];
-          for (const subDir of subDirs) {
-            const subDirPath = path.join(analysisDir, subDir);
-            if (fs.existsSync(subDirPath)) {
-              const files = fs.readdirSync(subDirPath);
-              // 处理每个分析文件
-              files.forEach((file) => {
-                if (file.endsWith(".md")) {
-                  const analysisType = file.split("-")[0];
-                  this.getAnalysisResult(analysisType);
-                }
-              });
-            }
+        // 遍历所有子目录
+        const subDirs = ["争议焦点", "诉讼策略", "风险评估", "法律意见"];
+        for (const subDir of subDirs) {
+          const subDirPath = path.join(analysisDir, subDir);
+
+          // 直接读取目录并捕获ENOENT，存在性检查与枚举合并为一次系统调用
+          let files;
+          try {
+            files = fs.readdirSync(subDirPath);
+          } catch (e) {
+            continue; // 该子目录不存在
           }
+
+          // 直接读取每个分析文件的内容
+          // （经getAnalysisResult会对每个文件重新扫描全部子目录，开销为二次方）
+          files.forEach((file) => {
+            if (!file.endsWith(".md")) return;
+
+            const analysisType = file.split("-")[0];
+            if (this.analysisResults[analysisType]) return; // 已加载
+
+            try {
+              const content = fs.readFileSync(
+                path.join(subDirPath, file),
+                "utf-8"
+              );
+              this.analysisResults[analysisType] = {
+                type: analysisType,
+                result: content,
+                createdAt: new Date().toISOString(),
+              };
+            } catch (e) {
+              console.error(`读取分析结果失败 ${file}: ${e.message}`);
+            }
+          });
         }
       }
 
-      // 然后尝试从旧版目录获取
+      // 然后尝试从旧版目录获取（同样直接读取并捕获ENOENT）
       const analysisDir = path.join(this.caseDataDir, "analysis");
 
-      if (fs.existsSync(analysisDir)) {
-        const files = fs.readdirSync(analysisDir);
-
-        files.forEach((file) => {
-          if (file.endsWith(".json")) {
-            const analysisType = file.replace(".json", "");
-            this.getAnalysisResult(analysisType);
-          }
-        });
+      let oldFiles = [];
+      try {
+        oldFiles = fs.readdirSync(analysisDir);
+      } catch (e) {
+        // 旧版分析目录不存在
       }
 
+      oldFiles.forEach((file) => {
+        if (!file.endsWith(".json")) return;
+
+        const analysisType = file.replace(".json", "");
+        if (this.analysisResults[analysisType]) return; // 新版目录结果优先
+
+        try {
+          this.analysisResults[analysisType] = JSON.parse(
+            fs.readFileSync(path.join(analysisDir, file), "utf-8")
+          );
+        } catch (e) {
+          console.error(`读取分析结果失败 ${file}: ${e.message}`);
+        }
+      });
+
       return this.analysisResults;
     } catch (err) {
       console.error(`获取所有分析结果出错: ${err.message}`);
@@ -470,24 +517,29 @@ class CaseType {
 
           for (const type of materialTypes) {
             const typeDir = path.join(materialsDir, type);
-            if (fs.existsSync(typeDir)) {
-              const files = fs.readdirSync(typeDir);
-
-              files.forEach((file) => {
-                if (file.endsWith(".txt")) {
-                  const filePath = path.join(typeDir, file);
-                  const content = fs.readFileSync(filePath, "utf-8");
-                  const name = file.replace(/\.txt$/, "").replace(/_/g, " ");
-
-                  this.materials.push({
-                    id: Date.now() + Math.random().toString().substring(2, 8),
-                    name: name,
-                    content: content,
-                    type: type,
-                    createdAt: fs.statSync(filePath).birthtime.toISOString(),
-                  });
-                }
-              });
+
+            // 直接读取目录并捕获ENOENT，单次遍历即可拿到类型信息
+            let entries;
+            try {
+              entries = fs.readdirSync(typeDir, { withFileTypes: true });
+            } catch (e) {
+              continue; // 该类型目录不存在
+            }
+
+            for (const entry of entries) {
+              if (entry.isFile() && entry.name.endsWith(".txt")) {
+                const filePath = path.join(typeDir, entry.name);
+                const content = fs.readFileSync(filePath, "utf-8");
+                const name = entry.name.replace(/\.txt$/, "").replace(/_/g, " ");
+
+                this.materials.push({
+                  id: Date.now() + Math.random().toString().substring(2, 8),
+                  name: name,
+                  content: content,
+                  type: type,
+                  createdAt: fs.statSync(filePath).birthtime.toISOString(),
+                });
+              }
             }
           }
         }
@@ -498,15 +550,16 @@ class CaseType {
         const materialsDir = path.join(this.caseDataDir, "materials");
 
         if (fs.existsSync(materialsDir)) {
-          const files = fs.readdirSync(materialsDir);
-
-          this.materials = files
-            .filter((file) => file.endsWith(".json"))
-            .map((file) => {
+          // 单次遍历直接累积，避免filter/map链产生的中间数组
+          const loaded = [];
+          for (const file of fs.readdirSync(materialsDir)) {
+            if (file.endsWith(".json")) {
               const filePath = path.join(materialsDir, file);
-              return JSON.parse(fs.readFileSync(filePath, "utf-8"));
-            })
-            .sort((a, b) => new Date(a.createdAt) - new Date(b.createdAt));
+              loaded.push(JSON.parse(fs.readFileSync(filePath, "utf-8")));
+            }
+          }
+          loaded.sort((a, b) => new Date(a.createdAt) - new Date(b.createdAt));
+          this.materials = loaded;
         }
       }
 
@@ -549,12 +602,14 @@ class CaseType {
    */
   addParty(name, role, info = {}) {
     try {
+      // 统一取一次时间，当事人ID与创建时间保持一致
+      const now = new Date();
       const party = {
-        id: Date.now().toString(),
+        id: now.getTime().toString(),
         name: name,
         role: role,
         info: info,
-        createdAt: new Date().toISOString(),
+        createdAt: now.toISOString(),
       };
 
       // 根据角色添加到对应列表
@@ -601,14 +656,16 @@ class CaseType {
    * @param {Date} eventDate - 事件日期，默认为当前时间
    * @returns {boolean} - 是否添加成功
    */
-  addTimelineEvent(title, description, eventDate = new Date()) {
+  addTimelineEvent(title, description, eventDate = null) {
     try {
+      // 统一取一次时间，事件ID、默认日期与创建时间保持一致
+      const now = new Date();
       const event = {
-        id: Date.now().toString(),
+        id: now.getTime().toString(),
         title: title,
         description: description,
-        date: eventDate.toISOString(),
-        createdAt: new Date().toISOString(),
+        date: (eventDate || now).toISOString(),
+        createdAt: now.toISOString(),
       };
 
       // 添加到时间线
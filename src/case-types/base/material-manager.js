@@ -43,15 +43,16 @@ class MaterialManager {
   loadMaterials() {
     try {
       if (fs.existsSync(this.materialsDir)) {
-        const files = fs.readdirSync(this.materialsDir);
-
-        this.materials = files
-          .filter((file) => file.endsWith(".json"))
-          .map((file) => {
+        // 单次遍历直接累积，避免filter/map链产生的中间数组
+        const loaded = [];
+        for (const file of fs.readdirSync(this.materialsDir)) {
+          if (file.endsWith(".json")) {
             const filePath = path.join(this.materialsDir, file);
-            return JSON.parse(fs.readFileSync(filePath, "utf-8"));
-          })
-          .sort((a, b) => new Date(a.createdAt) - new Date(b.createdAt));
+            loaded.push(JSON.parse(fs.readFileSync(filePath, "utf-8")));
+          }
+        }
+        loaded.sort((a, b) => new Date(a.createdAt) - new Date(b.createdAt));
+        this.materials = loaded;
       }
 
       return this.materials;
@@ -5,6 +5,7 @@
 const path = require("path");
 const fs = require("fs");
 const { getGoalSettingReminder, getCaseAnalysisPrompt } = require("../config/ai_instructions");
+const { findCaseDirectory, readMaterialsRecursively, writeFileAtomicSync, stripCasePrefix } = require("../utils/case_utils");
 
 /**
  * 案件分析命令处理函数
@@ -78,7 +79,7 @@ async function analyzeDisputeFocus(caseName, context) {
     }
 
     console.log(`正在读取案件材料目录: ${materialsDir}`);
-    const materials = readMaterialsRecursively(materialsDir);
+    const materials = await readMaterialsRecursively(materialsDir);
 
     if (materials.length === 0) {
       return `案件材料不足，无法进行分析。请在"案件材料"目录中添加相关文档。`;
@@ -87,9 +88,7 @@ async function analyzeDisputeFocus(caseName, context) {
     console.log(`找到 ${materials.length} 个材料文件，开始AI分析...`);
     
     // 提取实际案件名称
-    const actualCaseName = foundCaseDir.startsWith("案件：")
-      ? foundCaseDir.substring(3)
-      : foundCaseDir;
+    const actualCaseName = stripCasePrefix(foundCaseDir);
 
     // 检查并读取目标设定文件
     const goalSettingPath = path.join(caseFolderPath, "目标设定.md");
@@ -109,12 +108,22 @@ async function analyzeDisputeFocus(caseName, context) {
     }
 
     // 构建包含目标设定的分析内容
-    const analysisContent = [
-      goalReminder,
-      goalSettingContent ? `\n## 案件目标设定\n${goalSettingContent}\n` : "",
-      "## 案件材料\n",
-      materials.map((m) => `【${m.name}】\n${m.content}`).join("\n\n--- 材料分隔线 ---\n\n")
-    ].join("");
+    // 所有片段累积在同一个数组里一次join，不先拼出材料子串（峰值内存降为一份文档）
+    const parts = [goalReminder];
+    if (goalSettingContent) {
+      parts.push(`\n## 案件目标设定\n${goalSettingContent}\n`);
+    }
+    parts.push("## 案件材料\n");
+
+    const separator = "\n\n--- 材料分隔线 ---\n\n";
+    materials.forEach((m, index) => {
+      if (index > 0) {
+        parts.push(separator);
+      }
+      parts.push(`【${m.name}】\n`, m.content);
+    });
+
+    const analysisContent = parts.join("");
 
     // 使用AI引擎分析争议焦点
     const result = await context.aiEngine.analyze(
@@ -134,7 +143,7 @@ async function analyzeDisputeFocus(caseName, context) {
     const filename = `争议焦点分析_${timestamp}.md`;
     const filePath = path.join(analysisDir, filename);
     
-    fs.writeFileSync(filePath, result, 'utf8');
+    writeFileAtomicSync(filePath, result);
     console.log(`分析结果已保存到: ${filePath}`);
 
     const finalResult = [
@@ -154,103 +163,6 @@ async function analyzeDisputeFocus(caseName, context) {
   }
 }
 
-/**
- * 查找案件目录
- *
- * @param {string} casesDir - 案例根目录
- * @param {string} caseName - 案件名称
- * @returns {string|null} - 找到的案件目录名称或null
- */
-function findCaseDirectory(casesDir, caseName) {
-  const allDirs = fs.readdirSync(casesDir).filter(item => {
-    const itemPath = path.join(casesDir, item);
-    return fs.statSync(itemPath).isDirectory() && item !== "案件模板";
-  });
-
-  // 完全匹配优先
-  for (const dir of allDirs) {
-    if (dir === caseName || dir === `案件：${caseName}`) {
-      console.log(`找到完全匹配案件: ${dir}`);
-      return dir;
-    }
-  }
-
-  // 部分匹配（包含关系）
-  for (const dir of allDirs) {
-    if (dir.includes(caseName) || 
-        (dir.startsWith("案件：") && dir.substring(3).includes(caseName))) {
-      console.log(`找到部分匹配案件: ${dir}`);
-      return dir;
-    }
-  }
-
-  // 关键词匹配
-  if (caseName.length > 2) {
-    const keywords = caseName.split(/\s+/).filter(k => k.length > 1);
-    for (const dir of allDirs) {
-      if (keywords.some(keyword => 
-          dir.includes(keyword) || 
-          (dir.startsWith("案件：") && dir.substring(3).includes(keyword))
-      )) {
-        console.log(`找到关键词匹配案件: ${dir}`);
-        return dir;
-      }
-    }
-  }
-
-  return null;
-}
-
-/**
- * 递归读取材料目录中的所有文档
- *
- * @param {string} materialsDir - 材料目录路径
- * @returns {Array<Object>} - 材料对象数组，每个对象包含name和content
- */
-function readMaterialsRecursively(materialsDir) {
-  const materials = [];
-  const supportedExtensions = [".txt", ".md", ".doc", ".docx"];
-
-  function readDirectory(dir, relativePath = "") {
-    try {
-      const items = fs.readdirSync(dir);
-      
-      for (const item of items) {
-        const itemPath = path.join(dir, item);
-        const stat = fs.statSync(itemPath);
-        
-        if (stat.isDirectory()) {
-          // 递归读取子目录
-          const newRelativePath = relativePath ? `${relativePath}/${item}` : item;
-          readDirectory(itemPath, newRelativePath);
-        } else {
-          // 检查文件扩展名
-          const ext = path.extname(item).toLowerCase();
-          if (supportedExtensions.includes(ext)) {
-            try {
-              const content = fs.readFileSync(itemPath, "utf8");
-              const materialName = relativePath ? `${relativePath}/${item}` : item;
-              materials.push({
-                name: materialName,
-                content: content.trim(),
-                path: itemPath
-              });
-              console.log(`读取材料文件: ${materialName}`);
-            } catch (e) {
-              console.error(`读取文件失败 ${itemPath}: ${e.message}`);
-            }
-          }
-        }
-      }
-    } catch (e) {
-      console.error(`读取目录失败 ${dir}: ${e.message}`);
-    }
-  }
-
-  readDirectory(materialsDir);
-  return materials;
-}
-
 // 导出命令定义
 module.exports = {
   name: "analyze_case",
@@ -4,8 +4,21 @@
 
 const path = require("path");
 const fs = require("fs");
-const { v4: uuidv4 } = require("uuid");
 const { createGoalSettingContent } = require("../utils/goal_setting");
+const { writeFileAtomicSync, clearCasePathCache } = require("../utils/case_utils");
+
+// 支持的案件类型（模块级常量，Set成员判断为O(1)）
+const VALID_CASE_TYPES = new Set(["民商事", "刑事", "行政", "非诉"]);
+const VALID_CASE_TYPES_TEXT = [...VALID_CASE_TYPES].join(", ");
+
+// README字段更新用的正则（模块级编译一次，避免每次创建案件都重新构造）
+const RE_README_TITLE = /# .*/;
+const RE_README_CASE_NAME = /- 案件名称：.*/;
+const RE_README_CASE_TYPE = /- 案件类型：.*/;
+const RE_README_CREATE_TIME = /- 创建时间：.*/;
+const RE_README_CASE_ID = /- 案件ID：.*/;
+const RE_README_BUSINESS_TYPE = /- 业务类型：.*/;
+const RE_README_CASE_ID_LINE = /- 案件ID：.*\n/;
 
 /**
  * 创建案件命令处理函数
@@ -25,16 +38,18 @@ async function handler(args, context) {
     const businessType = args.length > 2 ? args[2] : null;
 
     // 验证案件类型
-    const validCaseTypes = ["民商事", "刑事", "行政", "非诉"];
-    if (!validCaseTypes.includes(caseType)) {
-      return `不支持的案件类型: ${caseType}\n支持的案件类型: ${validCaseTypes.join(
-        ", "
-      )}`;
+    if (!VALID_CASE_TYPES.has(caseType)) {
+      return `不支持的案件类型: ${caseType}\n支持的案件类型: ${VALID_CASE_TYPES_TEXT}`;
     }
 
-    // 生成案件ID
+    // 生成案件ID（延迟加载uuid：命令注册时无需承担其启动开销）
+    const { v4: uuidv4 } = require("uuid");
     const caseId = uuidv4();
 
+    // 统一取一次时间，保证案件信息、时间线和README的时间戳一致
+    const now = new Date();
+    const nowIso = now.toISOString();
+
     // 创建案件目录结构
     const caseFolderName = `案件：${caseName}`;
     const caseFolderPath = path.join(process.cwd(), "cases", caseFolderName);
@@ -52,7 +67,7 @@ async function handler(args, context) {
       if (fs.existsSync(templatePath)) {
         // 使用模板创建案件目录结构
         console.log("使用案件模板创建目录结构...");
-        copyFolderRecursiveSync(templatePath, casesDir, caseFolderName);
+        copyTemplateFromManifest(templatePath, caseFolderPath);
       } else {
         // 如果模板不存在，创建基本目录结构
         console.log("案件模板不存在，创建基本目录结构...");
@@ -65,8 +80,8 @@ async function handler(args, context) {
         name: caseName,
         type: caseType,
         businessType: businessType || "",
-        createTime: new Date().toISOString(),
-        lastUpdateTime: new Date().toISOString(),
+        createTime: nowIso,
+        lastUpdateTime: nowIso,
         parties: {
           plaintiffs: [], // 原告列表
           defendants: [], // 被告列表
@@ -76,11 +91,11 @@ async function handler(args, context) {
         analyses: [],
         timeline: [
           {
-            id: Date.now().toString(),
+            id: now.getTime().toString(),
             title: "创建案件",
             description: `创建案件：${caseName}`,
-            date: new Date().toISOString(),
-            createdAt: new Date().toISOString(),
+            date: nowIso,
+            createdAt: nowIso,
           },
         ],
         status: "进行中", // 案件状态：进行中、已结案、中止
@@ -97,40 +112,41 @@ async function handler(args, context) {
       if (fs.existsSync(readmePath)) {
         // 如果已存在README，更新其内容
         let readmeContent = fs.readFileSync(readmePath, "utf8");
-        readmeContent = readmeContent.replace(/# .*/, `# ${caseName}`);
+        readmeContent = readmeContent.replace(RE_README_TITLE, `# ${caseName}`);
         readmeContent = readmeContent.replace(
-          /- 案件名称：.*/,
+          RE_README_CASE_NAME,
           `- 案件名称：${caseName}`
         );
         readmeContent = readmeContent.replace(
-          /- 案件类型：.*/,
+          RE_README_CASE_TYPE,
           `- 案件类型：${caseType}`
         );
         readmeContent = readmeContent.replace(
-          /- 创建时间：.*/,
-          `- 创建时间：${new Date().toLocaleString()}`
+          RE_README_CREATE_TIME,
+          `- 创建时间：${now.toLocaleString()}`
         );
         readmeContent = readmeContent.replace(
-          /- 案件ID：.*/,
+          RE_README_CASE_ID,
           `- 案件ID：${caseId}`
         );
 
         if (businessType) {
           if (readmeContent.includes("- 业务类型：")) {
             readmeContent = readmeContent.replace(
-              /- 业务类型：.*/,
+              RE_README_BUSINESS_TYPE,
               `- 业务类型：${businessType}`
             );
           } else {
             // 在案件ID后面添加业务类型
             readmeContent = readmeContent.replace(
-              /- 案件ID：.*\n/,
+              RE_README_CASE_ID_LINE,
               `- 案件ID：${caseId}\n- 业务类型：${businessType}\n`
             );
           }
         }
 
-        fs.writeFileSync(readmePath, readmeContent, "utf8");
+        // 原子化写回，避免替换过程中断留下残缺的README
+        writeFileAtomicSync(readmePath, readmeContent);
       } else {
         // 如果不存在README，创建新的
         createReadmeFile(
@@ -138,7 +154,8 @@ async function handler(args, context) {
           caseName,
           caseType,
           caseId,
-          businessType
+          businessType,
+          now
         );
       }
 
@@ -157,11 +174,11 @@ async function handler(args, context) {
         // 创建默认时间线文件
         const defaultTimeline = [
           {
-            id: Date.now().toString(),
+            id: now.getTime().toString(),
             title: "创建案件",
             description: `创建案件：${caseName}`,
-            date: new Date().toISOString(),
-            createdAt: new Date().toISOString(),
+            date: nowIso,
+            createdAt: nowIso,
           },
         ];
 
@@ -185,6 +202,9 @@ async function handler(args, context) {
       return `创建案件目录结构失败: ${err.message}`;
     }
 
+    // 新目录已落盘，清空路径解析缓存
+    clearCasePathCache();
+
     // 创建案件
     const newCase = context.assistant.createCase(
       caseId,
@@ -202,100 +222,72 @@ async function handler(args, context) {
   }
 }
 
+// 模板目录清单缓存：模板在进程生命周期内不会变化，只需枚举一次
+let templateManifest = null;
+
 /**
- * 递归复制文件夹
+ * 获取模板目录清单（首次调用时枚举并缓存）
  *
- * @param {string} source - 源文件夹路径
- * @param {string} targetDir - 目标目录
- * @param {string} newFolderName - 新文件夹名称
+ * @param {string} templatePath - 模板目录路径
+ * @returns {Object} - 清单对象，包含dirs和files两个相对路径数组
  */
-function copyFolderRecursiveSync(source, targetDir, newFolderName) {
-  // 创建目标文件夹
-  const targetFolderPath = path.join(targetDir, newFolderName);
-  if (!fs.existsSync(targetFolderPath)) {
-    fs.mkdirSync(targetFolderPath, { recursive: true });
+function getTemplateManifest(templatePath) {
+  if (templateManifest) {
+    return templateManifest;
   }
 
-  // 读取源文件夹中的所有项目
-  const items = fs.readdirSync(source);
-
-  // 复制每个项目到目标文件夹
-  for (const item of items) {
-    // 忽略.DS_Store文件
-    if (item === ".DS_Store") continue;
-
-    const sourcePath = path.join(source, item);
-    const targetPath = path.join(targetFolderPath, item);
-
-    // 检查是否是目录
-    const stats = fs.statSync(sourcePath);
-    if (stats.isDirectory()) {
-      // 递归复制子目录
-      if (!fs.existsSync(targetPath)) {
-        fs.mkdirSync(targetPath, { recursive: true });
-      }
-
-      // 读取子目录中的所有项目
-      const subItems = fs.readdirSync(sourcePath);
-      for (const subItem of subItems) {
-        if (subItem === ".DS_Store") continue;
+  const dirs = [];
+  const files = [];
 
-        const subSourcePath = path.join(sourcePath, subItem);
-        const subTargetPath = path.join(targetPath, subItem);
+  function walk(dir, relativePath) {
+    for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
+      // 忽略.DS_Store文件
+      if (entry.name === ".DS_Store") continue;
 
-        const subStats = fs.statSync(subSourcePath);
-        if (subStats.isDirectory()) {
-          // 递归创建子目录
-          if (!fs.existsSync(subTargetPath)) {
-            fs.mkdirSync(subTargetPath, { recursive: true });
-          }
+      const relPath = relativePath
+        ? path.join(relativePath, entry.name)
+        : entry.name;
 
-          // 继续复制子目录的内容
-          copyFolderContentsSync(subSourcePath, subTargetPath);
-        } else {
-          // 复制文件
-          fs.copyFileSync(subSourcePath, subTargetPath);
-        }
-      }
-    } else {
-      // 复制文件（忽略README.md，因为我们会创建新的）
-      if (item !== "README.md") {
-        fs.copyFileSync(sourcePath, targetPath);
+      if (entry.isDirectory()) {
+        dirs.push(relPath);
+        walk(path.join(dir, entry.name), relPath);
+      } else {
+        files.push(relPath);
       }
     }
   }
+
+  walk(templatePath, "");
+  templateManifest = { dirs, files };
+  return templateManifest;
 }
 
 /**
- * 复制文件夹内容
+ * 按缓存的模板清单复制案件目录结构
  *
- * @param {string} source - 源文件夹路径
- * @param {string} target - 目标文件夹路径
+ * @param {string} templatePath - 模板目录路径
+ * @param {string} targetFolderPath - 目标案件文件夹路径
  */
-function copyFolderContentsSync(source, target) {
-  // 读取源文件夹中的所有项目
-  const items = fs.readdirSync(source);
-
-  // 复制每个项目到目标文件夹
-  for (const item of items) {
-    // 忽略.DS_Store文件
-    if (item === ".DS_Store") continue;
-
-    const sourcePath = path.join(source, item);
-    const targetPath = path.join(target, item);
-
-    // 检查是否是目录
-    const stats = fs.statSync(sourcePath);
-    if (stats.isDirectory()) {
-      // 递归复制子目录
-      if (!fs.existsSync(targetPath)) {
-        fs.mkdirSync(targetPath, { recursive: true });
-      }
-      copyFolderContentsSync(sourcePath, targetPath);
-    } else {
-      // 复制文件
-      fs.copyFileSync(sourcePath, targetPath);
-    }
+function copyTemplateFromManifest(templatePath, targetFolderPath) {
+  const { dirs, files } = getTemplateManifest(templatePath);
+
+  fs.mkdirSync(targetFolderPath, { recursive: true });
+
+  for (const dir of dirs) {
+    fs.mkdirSync(path.join(targetFolderPath, dir), { recursive: true });
+  }
+
+  for (const file of files) {
+    // 忽略模板根目录的README.md，因为我们会创建新的
+    if (file === "README.md") continue;
+
+    // COPYFILE_FICLONE：支持写时复制的文件系统（btrfs/xfs/APFS）上
+    // 克隆只是元数据操作，不逐字节复制；不支持时内核自动回退为普通复制
+    fs.copyFileSync(
+      path.join(templatePath, file),
+      path.join(targetFolderPath, file),
+      fs.constants.COPYFILE_FICLONE
+    );
   }
 }
 
@@ -333,6 +325,29 @@ function createBasicCaseStructure(caseFolderPath) {
   }
 }
 
+// README静态部分：与具体案件无关，模块加载时构建一次即可
+const README_STATIC_SECTIONS = `## 案件目录结构说明
+- 案件材料/
+  - 原告/ - 存放原告方提供的材料和证据
+  - 被告/ - 存放被告方提供的材料和证据
+  - 第三人/ - 存放第三人提供的材料和证据
+- 分析/
+  - 争议焦点/ - 存放案件争议焦点分析
+  - 诉讼策略/ - 存放案件诉讼策略分析
+  - 证据分析/ - 存放证据分析报告
+  - 案例研究/ - 存放相关案例研究
+- 文书/ - 存放各类法律文书
+- 庭审/ - 存放庭审相关材料
+- 法律规范/ - 存放案件相关法律法规
+- 时间线/ - 存放案件进展时间线
+
+## 操作指南
+1. 使用"添加材料"命令添加案件材料
+2. 使用"分析案件"命令分析案件争议焦点
+3. 使用"诉讼策略"命令制定案件诉讼策略
+4. 使用"添加当事人"命令添加案件当事人信息
+`;
+
 /**
  * 创建README文件
  *
@@ -341,44 +356,27 @@ function createBasicCaseStructure(caseFolderPath) {
  * @param {string} caseType - 案件类型
  * @param {string} caseId - 案件ID
  * @param {string} businessType - 业务类型（可选）
+ * @param {Date} now - 创建时间（与案件信息使用同一时间戳）
  */
 function createReadmeFile(
   caseFolderPath,
   caseName,
   caseType,
   caseId,
-  businessType
+  businessType,
+  now
 ) {
+  // 只有基本信息部分依赖参数，静态段落直接复用模块级常量
   const readmeContent = `# ${caseName}
 
 ## 案件基本信息
 - 案件名称：${caseName}
 - 案件类型：${caseType}
 ${businessType ? `- 业务类型：${businessType}` : ""}
-- 创建时间：${new Date().toLocaleString()}
+- 创建时间：${now.toLocaleString()}
 - 案件ID：${caseId}
 
-## 案件目录结构说明
-- 案件材料/
-  - 原告/ - 存放原告方提供的材料和证据
-  - 被告/ - 存放被告方提供的材料和证据
-  - 第三人/ - 存放第三人提供的材料和证据
-- 分析/
-  - 争议焦点/ - 存放案件争议焦点分析
-  - 诉讼策略/ - 存放案件诉讼策略分析
-  - 证据分析/ - 存放证据分析报告
-  - 案例研究/ - 存放相关案例研究
-- 文书/ - 存放各类法律文书
-- 庭审/ - 存放庭审相关材料
-- 法律规范/ - 存放案件相关法律法规
-- 时间线/ - 存放案件进展时间线
-
-## 操作指南
-1. 使用"添加材料"命令添加案件材料
-2. 使用"分析案件"命令分析案件争议焦点
-3. 使用"诉讼策略"命令制定案件诉讼策略
-4. 使用"添加当事人"命令添加案件当事人信息
-`;
+${README_STATIC_SECTIONS}`;
 
   fs.writeFileSync(
     path.join(caseFolderPath, "README.md"),
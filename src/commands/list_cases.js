@@ -18,26 +18,26 @@ async function handler(args, context) {
       return "当前没有任何案件，请先创建案件。";
     }
 
-    // 构建返回信息
-    let result = "案件列表:\n";
-    result += "=".repeat(50) + "\n";
+    // 构建返回信息（数组累积片段，最后一次join，避免循环内字符串拼接）
+    const lines = ["案件列表:", "=".repeat(50)];
+    const divider = "-".repeat(50);
 
     caseList.forEach((caseItem, index) => {
-      result += `${index + 1}. ID: ${caseItem.id}\n`;
-      result += `   名称: ${caseItem.name}\n`;
-      result += `   类型: ${caseItem.type}\n`;
+      lines.push(`${index + 1}. ID: ${caseItem.id}`);
+      lines.push(`   名称: ${caseItem.name}`);
+      lines.push(`   类型: ${caseItem.type}`);
 
       // 标记当前选中的案件
       if (context.currentCase && context.currentCase.caseId === caseItem.id) {
-        result += "   [当前选中]\n";
+        lines.push("   [当前选中]");
       }
 
-      result += "-".repeat(50) + "\n";
+      lines.push(divider);
     });
 
-    result += '\n使用 "/switch_case <案件ID>" 命令切换案件';
+    lines.push('\n使用 "/switch_case <案件ID>" 命令切换案件');
 
-    return result;
+    return lines.join("\n");
   } catch (err) {
     console.error("列出案件出错:", err);
     return `列出案件出错: ${err.message}`;
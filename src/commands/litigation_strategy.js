@@ -4,6 +4,7 @@
 
 const path = require("path");
 const fs = require("fs");
+const { findCaseDirectory, readMaterialsRecursively, writeFileAtomicSync, stripCasePrefix } = require("../utils/case_utils");
 
 /**
  * 诉讼策略命令处理函数
@@ -67,7 +68,7 @@ async function makeLitigationStrategy(caseName, context) {
     }
 
     console.log(`正在读取案件材料目录: ${materialsDir}`);
-    const materials = readMaterialsRecursively(materialsDir);
+    const materials = await readMaterialsRecursively(materialsDir);
 
     if (materials.length === 0) {
       return `案件材料不足，无法制定诉讼策略。请在"案件材料"目录中添加相关文档。`;
@@ -76,9 +77,7 @@ async function makeLitigationStrategy(caseName, context) {
     console.log(`找到 ${materials.length} 个材料文件，开始AI分析...`);
     
     // 提取实际案件名称
-    const actualCaseName = foundCaseDir.startsWith("案件：")
-      ? foundCaseDir.substring(3)
-      : foundCaseDir;
+    const actualCaseName = stripCasePrefix(foundCaseDir);
 
     // 使用AI引擎分析诉讼策略
     const result = await context.aiEngine.analyzeLitigationStrategy(
@@ -96,7 +95,7 @@ async function makeLitigationStrategy(caseName, context) {
     const filename = `诉讼策略分析_${timestamp}.md`;
     const filePath = path.join(analysisDir, filename);
     
-    fs.writeFileSync(filePath, result, 'utf8');
+    writeFileAtomicSync(filePath, result);
     console.log(`分析结果已保存到: ${filePath}`);
 
     return `诉讼策略制定完成！\n案件: ${actualCaseName}\n分析结果已保存到: ${filename}\n\n分析结果:\n${result}`;
@@ -106,93 +105,6 @@ async function makeLitigationStrategy(caseName, context) {
   }
 }
 
-/**
- * 查找案件目录
- */
-function findCaseDirectory(casesDir, caseName) {
-  const allDirs = fs.readdirSync(casesDir).filter(item => {
-    const itemPath = path.join(casesDir, item);
-    return fs.statSync(itemPath).isDirectory() && item !== "案件模板";
-  });
-
-  // 完全匹配优先
-  for (const dir of allDirs) {
-    if (dir === caseName || dir === `案件：${caseName}`) {
-      console.log(`找到完全匹配案件: ${dir}`);
-      return dir;
-    }
-  }
-
-  // 部分匹配
-  for (const dir of allDirs) {
-    if (dir.includes(caseName) || 
-        (dir.startsWith("案件：") && dir.substring(3).includes(caseName))) {
-      console.log(`找到部分匹配案件: ${dir}`);
-      return dir;
-    }
-  }
-
-  // 关键词匹配
-  if (caseName.length > 2) {
-    const keywords = caseName.split(/\s+/).filter(k => k.length > 1);
-    for (const dir of allDirs) {
-      if (keywords.some(keyword => 
-          dir.includes(keyword) || 
-          (dir.startsWith("案件：") && dir.substring(3).includes(keyword))
-      )) {
-        console.log(`找到关键词匹配案件: ${dir}`);
-        return dir;
-      }
-    }
-  }
-
-  return null;
-}
-
-/**
- * 递归读取材料目录中的所有文档
- */
-function readMaterialsRecursively(materialsDir) {
-  const materials = [];
-  const supportedExtensions = [".txt", ".md", ".doc", ".docx"];
-
-  function readDirectory(dir, relativePath = "") {
-    try {
-      const items = fs.readdirSync(dir);
-      
-      for (const item of items) {
-        const itemPath = path.join(dir, item);
-        const stat = fs.statSync(itemPath);
-        
-        if (stat.isDirectory()) {
-          const newRelativePath = relativePath ? `${relativePath}/${item}` : item;
-          readDirectory(itemPath, newRelativePath);
-        } else {
-          const ext = path.extname(item).toLowerCase();
-          if (supportedExtensions.includes(ext)) {
-            try {
-              const content = fs.readFileSync(itemPath, "utf8");
-              const materialName = relativePath ? `${relativePath}/${item}` : item;
-              materials.push({
-                name: materialName,
-                content: content.trim()
-              });
-              console.log(`读取材料文件: ${materialName}`);
-            } catch (e) {
-              console.error(`读取文件失败 ${itemPath}: ${e.message}`);
-            }
-          }
-        }
-      }
-    } catch (e) {
-      console.error(`读取目录失败 ${dir}: ${e.message}`);
-    }
-  }
-
-  readDirectory(materialsDir);
-  return materials;
-}
-
 // 导出命令定义
 module.exports = {
   name: "litigation_strategy",
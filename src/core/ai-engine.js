@@ -5,11 +5,44 @@
 
 const fs = require("fs");
 const path = require("path");
-const axios = require("axios");
+// axios仅在真实API调用（下方注释掉的代码块）中使用，启用时在调用处require，
+// 避免每次启动都加载HTTP客户端
+
+// 提示词中材料内容的总量上限（字符数）：
+// 超出模型上下文的请求注定失败，提前按材料截断，避免白付一次请求开销
+const MAX_PROMPT_CHARS = 200 * 1024;
 
 class AIEngine {
   constructor() {
     this.promptsDir = path.join(__dirname, "..", "..", "prompts");
+    // 提示词缓存：以文件路径为键，记录解析结果和加载时的mtime
+    this.promptCache = new Map();
+  }
+
+  /**
+   * 读取并解析提示词文件，命中缓存且文件未修改时直接复用
+   *
+   * @private
+   * @param {string} filePath - 提示词文件路径
+   * @param {Function} parse - 将文件内容解析为提示词对象的函数
+   * @returns {object|null} - 提示词对象，文件不存在时返回null
+   */
+  _loadPromptFile(filePath, parse) {
+    let stat;
+    try {
+      stat = fs.statSync(filePath);
+    } catch (e) {
+      return null;
+    }
+
+    const cached = this.promptCache.get(filePath);
+    if (cached && cached.mtimeMs === stat.mtimeMs) {
+      return cached.data;
+    }
+
+    const data = parse(fs.readFileSync(filePath, "utf-8"));
+    this.promptCache.set(filePath, { mtimeMs: stat.mtimeMs, data });
+    return data;
   }
 
   /**
@@ -23,20 +56,20 @@ class AIEngine {
     try {
       const promptPath = path.join(this.promptsDir, category, `${name}.json`);
 
-      // 检查JSON文件是否存在
-      if (fs.existsSync(promptPath)) {
-        const promptData = JSON.parse(fs.readFileSync(promptPath, "utf-8"));
+      // 优先加载JSON文件
+      const promptData = this._loadPromptFile(promptPath, JSON.parse);
+      if (promptData) {
         return promptData;
       }
 
       // 尝试加载MD文件（向后兼容）
       const mdPath = path.join(this.promptsDir, "..", category, "index.md");
-      if (fs.existsSync(mdPath)) {
-        const mdContent = fs.readFileSync(mdPath, "utf-8");
-        return {
-          title: `${category} ${name}`,
-          originalContent: mdContent,
-        };
+      const mdData = this._loadPromptFile(mdPath, (mdContent) => ({
+        title: `${category} ${name}`,
+        originalContent: mdContent,
+      }));
+      if (mdData) {
+        return mdData;
       }
 
       console.log(`错误: 未找到提示词 ${category}/${name}`);
@@ -59,7 +92,15 @@ class AIEngine {
   async analyze(caseName, materials, promptCategory, promptName) {
     console.log(`正在使用AI分析案件材料...`);
 
+    // 统一取一次日期，正常结果与错误模板使用同一时间戳
+    const currentDate = new Date().toISOString().split("T")[0]; // YYYY-MM-DD
+
     try {
+      // 空材料直接走错误路径，不加载提示词、不构建请求体
+      if (Array.isArray(materials) ? materials.length === 0 : !materials) {
+        throw new Error("没有案件材料可供分析");
+      }
+
       // 加载提示词
       const promptData = this.loadPrompt(promptCategory, promptName);
       if (!promptData) {
@@ -70,18 +111,10 @@ class AIEngine {
       const promptContent = promptData.originalContent || 
         this._formatStructuredPrompt(promptData);
 
-      // 准备请求内容 - 确保materials是数组
-      let materialContent;
-      if (Array.isArray(materials)) {
-        materialContent = materials.join("\n\n--- 材料分隔线 ---\n\n");
-      } else if (typeof materials === 'string') {
-        materialContent = materials;
-      } else {
-        throw new Error('materials参数必须是数组或字符串');
-      }
-
-      // 构建请求体
-      const prompt = `
+      // 构建请求体：所有片段（含逐份材料）进同一个数组一次join，
+      // 不先拼出材料子串再整体插值，峰值内存只保留一份完整提示词
+      const parts = [
+        `
 你是一名${promptData.role || "资深法律专家"}，${promptData.description || ""}
 
 ${promptContent}
@@ -89,14 +122,33 @@ ${promptContent}
 案件名称：${caseName}
 
 以下是案件材料：
-${materialContent}
+`,
+      ];
+
+      if (Array.isArray(materials)) {
+        const contents = this._capMaterialContents(materials);
+        contents.forEach((content, index) => {
+          if (index > 0) {
+            parts.push("\n\n--- 材料分隔线 ---\n\n");
+          }
+          parts.push(content);
+        });
+      } else if (typeof materials === 'string') {
+        parts.push(this._capMaterialContents([materials])[0]);
+      } else {
+        throw new Error('materials参数必须是数组或字符串');
+      }
+
+      parts.push(`
 
 请根据上述方法论，分析案件并给出结果。
-`;
+`);
+      const prompt = parts.join("");
 
       // 调用OpenAI API或其他可用的AI服务
       // 这里使用本地模拟调用，替换为实际API调用
       /*
+      const axios = require("axios");
       const response = await axios.post(
         "https://api.openai.com/v1/chat/completions",
         {
@@ -119,7 +171,6 @@ ${materialContent}
       await new Promise((resolve) => setTimeout(resolve, 2000)); // 模拟API调用延迟
 
       // 生成模拟结果
-      const currentDate = new Date().toISOString().split("T")[0]; // YYYY-MM-DD
       const result = this._generateMockResult(
         caseName,
         promptName,
@@ -130,7 +181,6 @@ ${materialContent}
       return result;
     } catch (e) {
       console.log(`AI分析出错: ${e.message}`);
-      const currentDate = new Date().toISOString().split("T")[0]; // YYYY-MM-DD
       return `
 # ${caseName} 分析 (AI分析出错)
 
@@ -157,6 +207,9 @@ ${e.message}
   async analyzeLitigationStrategy(materials, caseInfo) {
     console.log(`正在分析诉讼策略...`);
 
+    // 统一取一次日期，正常结果与错误模板使用同一时间戳
+    const currentDate = new Date().toISOString().split("T")[0]; // YYYY-MM-DD
+
     try {
       // 加载提示词
       const promptData = this.loadPrompt("civil", "litigation-strategy");
@@ -168,13 +221,10 @@ ${e.message}
       const promptContent =
         promptData.originalContent || JSON.stringify(promptData);
 
-      // 准备材料内容
-      const materialContent = materials
-        .map((m) => `【${m.name}】\n${m.content}`)
-        .join("\n\n--- 材料分隔线 ---\n\n");
-
-      // 构建请求体
-      const prompt = `
+      // 构建请求体：逐份材料与固定段落累积在同一数组一次join，
+      // 避免先拼材料子串再整体插值带来的双份大字符串
+      const parts = [
+        `
 你是一名资深诉讼律师，擅长制定民商事案件的诉讼策略。
 
 ${promptContent}
@@ -184,7 +234,20 @@ ${promptContent}
 ${caseInfo.businessType ? `业务类型：${caseInfo.businessType}` : ""}
 
 以下是案件材料：
-${materialContent}
+`,
+      ];
+
+      const contents = this._capMaterialContents(
+        materials.map((m) => m.content)
+      );
+      materials.forEach((m, index) => {
+        if (index > 0) {
+          parts.push("\n\n--- 材料分隔线 ---\n\n");
+        }
+        parts.push(`【${m.name}】\n`, contents[index]);
+      });
+
+      parts.push(`
 
 请根据上述材料，分析案情并制定详细的诉讼策略。请包含以下内容：
 1. 案件评估摘要
@@ -196,11 +259,13 @@ ${materialContent}
 7. 时间线规划
 
 请给出详细、专业、可操作的诉讼策略报告。
-`;
+`);
+      const prompt = parts.join("");
 
       // 调用OpenAI API或其他可用的AI服务
       // 这里使用本地模拟调用，替换为实际API调用
       /*
+      const axios = require("axios");
       const response = await axios.post(
         "https://api.openai.com/v1/chat/completions",
         {
@@ -223,7 +288,6 @@ ${materialContent}
       await new Promise((resolve) => setTimeout(resolve, 2000)); // 模拟API调用延迟
 
       // 生成模拟结果
-      const currentDate = new Date().toISOString().split("T")[0]; // YYYY-MM-DD
       const result = this._generateMockResult(
         caseInfo.name,
         "litigation-strategy",
@@ -234,7 +298,6 @@ ${materialContent}
       return result;
     } catch (e) {
       console.log(`诉讼策略分析出错: ${e.message}`);
-      const currentDate = new Date().toISOString().split("T")[0]; // YYYY-MM-DD
       return `
 # ${caseInfo.name} 诉讼策略分析 (分析出错)
 
@@ -252,6 +315,26 @@ ${e.message}
     }
   }
 
+  /**
+   * 将材料内容截断到总量上限内（超限时每份材料平均分配额度）
+   *
+   * @private
+   * @param {Array<string>} contents - 材料内容数组
+   * @returns {Array<string>} - 截断后的材料内容数组
+   */
+  _capMaterialContents(contents) {
+    const total = contents.reduce((sum, c) => sum + c.length, 0);
+    if (total <= MAX_PROMPT_CHARS) {
+      return contents;
+    }
+
+    console.log(`材料总量超出上限，已按材料截断（共${contents.length}份）`);
+    const cap = Math.floor(MAX_PROMPT_CHARS / contents.length);
+    return contents.map((c) =>
+      c.length > cap ? c.slice(0, cap) + "\n…[内容过长，已截断]" : c
+    );
+  }
+
   /**
    * 格式化结构化提示词
    *
@@ -260,47 +343,48 @@ ${e.message}
    * @returns {string} - 格式化后的提示词内容
    */
   _formatStructuredPrompt(promptData) {
-    let content = `# ${promptData.title || '法律分析方法论'}\n\n`;
-    
+    // 用数组累积片段，最后一次join——避免循环内字符串拼接的二次方开销
+    const parts = [`# ${promptData.title || '法律分析方法论'}\n\n`];
+
     if (promptData.methodology) {
-      content += '## 分析框架\n\n';
-      
+      parts.push('## 分析框架\n\n');
+
       Object.entries(promptData.methodology).forEach(([key, value]) => {
         const title = key.replace(/_/g, '：');
-        content += `### ${title}\n`;
-        
+        parts.push(`### ${title}\n`);
+
         Object.entries(value).forEach(([subKey, subValue]) => {
-          content += `\n**${subKey}**\n`;
+          parts.push(`\n**${subKey}**\n`);
           if (Array.isArray(subValue)) {
             subValue.forEach(item => {
-              content += `- ${item}\n`;
+              parts.push(`- ${item}\n`);
             });
           }
         });
-        content += '\n';
+        parts.push('\n');
       });
     }
-    
+
     if (promptData.output_format) {
-      content += '## 输出要求\n\n请按照以下格式输出分析结果：\n\n';
-      
+      parts.push('## 输出要求\n\n请按照以下格式输出分析结果：\n\n');
+
       Object.entries(promptData.output_format).forEach(([key, value]) => {
         if (key === '争议焦点总结') {
-          content += `### ${key}\n${value}\n\n`;
+          parts.push(`### ${key}\n${value}\n\n`);
         } else {
           const title = key.replace(/_/g, '：');
-          content += `### ${title}\n`;
+          parts.push(`### ${title}\n`);
           if (Array.isArray(value)) {
             value.forEach(item => {
-              content += `- ${item}：\n`;
+              parts.push(`- ${item}：\n`);
             });
           }
-          content += '\n';
+          parts.push('\n');
         }
       });
     }
-    
-    return content;
+
+    return parts.join('');
   }
 
   /**
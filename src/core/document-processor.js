@@ -6,6 +6,28 @@
 const fs = require("fs");
 const path = require("path");
 
+// 正则缓存：避免每次调用都重新编译相同的表达式
+const regexCache = new Map();
+
+/**
+ * 获取缓存的正则表达式（不存在时编译并缓存）
+ *
+ * @param {string} pattern - 正则表达式字符串
+ * @param {string} flags - 正则标志
+ * @returns {RegExp} - 编译后的正则表达式
+ */
+function getCachedRegex(pattern, flags = "") {
+  const key = `${pattern}\u0000${flags}`;
+  let regex = regexCache.get(key);
+
+  if (!regex) {
+    regex = new RegExp(pattern, flags);
+    regexCache.set(key, regex);
+  }
+
+  return regex;
+}
+
 class DocumentProcessor {
   /**
    * 从文本文件中提取内容
@@ -39,12 +61,13 @@ class DocumentProcessor {
 
     keywords.forEach((keyword) => {
       // 简单的关键词匹配，实际应用中可以使用更复杂的正则表达式或NLP技术
-      const regex = new RegExp(`${keyword}[：:](.*?)(?=\\n|$)`, "g");
+      const regex = getCachedRegex(`${keyword}[：:](.*?)(?=\\n|$)`, "g");
       const matches = text.match(regex);
 
       if (matches && matches.length > 0) {
+        const stripRegex = getCachedRegex(`${keyword}[：:]\\s*`);
         result[keyword] = matches.map((match) => {
-          return match.replace(new RegExp(`${keyword}[：:]\\s*`), "").trim();
+          return match.replace(stripRegex, "").trim();
         });
       } else {
         result[keyword] = [];
@@ -81,7 +104,7 @@ class DocumentProcessor {
     // 遍历schema中的每个字段
     Object.keys(schema).forEach((field) => {
       const fieldInfo = schema[field];
-      const regex = new RegExp(fieldInfo.pattern, fieldInfo.flags || "g");
+      const regex = getCachedRegex(fieldInfo.pattern, fieldInfo.flags || "g");
       const matches = text.match(regex);
 
       if (matches && matches.length > 0) {
@@ -139,21 +162,37 @@ class DocumentProcessor {
    */
   mergeDocuments(filePaths, outputPath) {
     try {
-      const contents = filePaths
-        .map((filePath) => {
-          const content = this.extractTextFromFile(filePath);
-          return content
-            ? `--- 来源: ${path.basename(filePath)} ---\n\n${content}`
-            : "";
-        })
-        .filter((content) => content.length > 0);
-
-      if (contents.length === 0) {
+      // 确保输出目录存在
+      const dir = path.dirname(outputPath);
+      if (!fs.existsSync(dir)) {
+        fs.mkdirSync(dir, { recursive: true });
+      }
+
+      // 逐个文档追加写入输出文件，内存峰值只有单个文档，
+      // 而不是先在内存里拼出全部文档的合并串
+      const separator = "\n\n" + "-".repeat(50) + "\n\n";
+      let mergedCount = 0;
+
+      for (const filePath of filePaths) {
+        const content = this.extractTextFromFile(filePath);
+        if (!content) continue;
+
+        const section = `--- 来源: ${path.basename(filePath)} ---\n\n${content}`;
+
+        if (mergedCount === 0) {
+          fs.writeFileSync(outputPath, section, "utf-8");
+        } else {
+          fs.appendFileSync(outputPath, separator + section, "utf-8");
+        }
+        mergedCount++;
+      }
+
+      if (mergedCount === 0) {
         throw new Error("没有有效的文档内容可合并");
       }
 
-      const mergedContent = contents.join("\n\n" + "-".repeat(50) + "\n\n");
-      return this.saveToFile(outputPath, mergedContent);
+      console.log(`文件已保存: ${outputPath}`);
+      return true;
     } catch (err) {
       console.error(`合并文档出错: ${err.message}`);
       return false;
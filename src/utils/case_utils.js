@@ -3,8 +3,200 @@
  */
 
 const fs = require("fs");
+const fsp = require("fs").promises;
 const path = require("path");
-const glob = require("glob");
+
+// 支持的材料文件扩展名（Set成员判断为O(1)）
+const SUPPORTED_EXTENSIONS = new Set([".txt", ".md", ".doc", ".docx"]);
+
+// 单个材料文件读取上限：内容最终进入上下文受限的AI提示词，超出部分下游也会被截断
+const MAX_MATERIAL_BYTES = 1024 * 1024;
+
+// 案件目录名前缀
+const CASE_PREFIX = "案件：";
+
+/**
+ * 去掉目录名开头的"案件："前缀，得到实际案件名称
+ * （replace会误删名称中间出现的同样子串，故只处理开头）
+ *
+ * @param {string} dirName - 案件目录名
+ * @returns {string} - 实际案件名称
+ */
+function stripCasePrefix(dirName) {
+  return dirName.startsWith(CASE_PREFIX)
+    ? dirName.slice(CASE_PREFIX.length)
+    : dirName;
+}
+
+/**
+ * 读取单个材料文件，超过大小上限时只读取上限部分并标注截断
+ *
+ * @param {string} filePath - 文件路径
+ * @returns {Promise<string>} - 文件内容
+ */
+async function readMaterialFile(filePath) {
+  const stat = await fsp.stat(filePath);
+
+  if (stat.size <= MAX_MATERIAL_BYTES) {
+    return fsp.readFile(filePath, "utf8");
+  }
+
+  // 超大文件只读上限字节数，避免为注定被截断的内容分配整个文件的内存
+  const handle = await fsp.open(filePath, "r");
+  try {
+    const buffer = Buffer.allocUnsafe(MAX_MATERIAL_BYTES);
+    const { bytesRead } = await handle.read(buffer, 0, MAX_MATERIAL_BYTES, 0);
+    return buffer.toString("utf8", 0, bytesRead) + "\n\n…[内容过长，已截断]";
+  } finally {
+    await handle.close();
+  }
+}
+
+/**
+ * 查找案件目录
+ *
+ * @param {string} casesDir - 案例根目录
+ * @param {string} caseName - 案件名称
+ * @returns {string|null} - 找到的案件目录名称或null
+ */
+function findCaseDirectory(casesDir, caseName) {
+  // 单次遍历目录，利用dirent类型信息过滤（避免逐项stat）
+  const allDirs = [];
+  for (const entry of fs.readdirSync(casesDir, { withFileTypes: true })) {
+    if (entry.isDirectory() && entry.name !== "案件模板") {
+      allDirs.push(entry.name);
+    }
+  }
+
+  // 完全匹配优先
+  for (const dir of allDirs) {
+    if (dir === caseName || dir === CASE_PREFIX + caseName) {
+      console.log(`找到完全匹配案件: ${dir}`);
+      return dir;
+    }
+  }
+
+  // 部分匹配（包含关系）
+  for (const dir of allDirs) {
+    if (dir.includes(caseName) ||
+        stripCasePrefix(dir).includes(caseName)) {
+      console.log(`找到部分匹配案件: ${dir}`);
+      return dir;
+    }
+  }
+
+  // 关键词匹配
+  if (caseName.length > 2) {
+    const keywords = caseName.split(/\s+/).filter(k => k.length > 1);
+    for (const dir of allDirs) {
+      if (keywords.some(keyword =>
+          dir.includes(keyword) ||
+          stripCasePrefix(dir).includes(keyword)
+      )) {
+        console.log(`找到关键词匹配案件: ${dir}`);
+        return dir;
+      }
+    }
+  }
+
+  return null;
+}
+
+/**
+ * 递归枚举材料目录中的所有文档路径（不读取内容）
+ *
+ * @param {string} materialsDir - 材料目录路径
+ * @returns {Array<Object>} - 文件对象数组，每个对象包含name和path
+ */
+function listMaterialFiles(materialsDir) {
+  const files = [];
+  const sep = path.sep;
+
+  function walk(dir, relativePath = "") {
+    try {
+      // 单次遍历目录，利用dirent类型信息区分子目录和文件（避免逐项stat）
+      const entries = fs.readdirSync(dir, { withFileTypes: true });
+
+      for (const entry of entries) {
+        const item = entry.name;
+        // 内层循环用模板字符串拼接路径：dir已规范化，无需path.join的完整逻辑
+        const itemPath = `${dir}${sep}${item}`;
+
+        if (entry.isDirectory()) {
+          // 递归枚举子目录
+          const newRelativePath = relativePath ? `${relativePath}/${item}` : item;
+          walk(itemPath, newRelativePath);
+        } else {
+          // 检查文件扩展名
+          const ext = path.extname(item).toLowerCase();
+          if (SUPPORTED_EXTENSIONS.has(ext)) {
+            files.push({
+              name: relativePath ? `${relativePath}/${item}` : item,
+              path: itemPath,
+            });
+          }
+        }
+      }
+    } catch (e) {
+      console.error(`读取目录失败 ${dir}: ${e.message}`);
+    }
+  }
+
+  walk(materialsDir);
+  return files;
+}
+
+/**
+ * 递归读取材料目录中的所有文档（文件内容并发读取，结果保持枚举顺序）
+ *
+ * @param {string} materialsDir - 材料目录路径
+ * @returns {Promise<Array<Object>>} - 材料对象数组，每个对象包含name和content
+ */
+async function readMaterialsRecursively(materialsDir) {
+  const files = listMaterialFiles(materialsDir);
+
+  // 磁盘读取并发执行；Promise.all保持与枚举一致的顺序
+  const loaded = await Promise.all(
+    files.map(async (file) => {
+      try {
+        const content = await readMaterialFile(file.path);
+        console.log(`读取材料文件: ${file.name}`);
+        return {
+          name: file.name,
+          content: content.trim(),
+          path: file.path,
+        };
+      } catch (e) {
+        console.error(`读取文件失败 ${file.path}: ${e.message}`);
+        return null;
+      }
+    })
+  );
+
+  return loaded.filter((m) => m !== null);
+}
+
+/**
+ * 原子化写入文件：先写临时文件再重命名，避免中途失败留下半个文件
+ *
+ * @param {string} filePath - 目标文件路径
+ * @param {string|Buffer} content - 文件内容
+ */
+function writeFileAtomicSync(filePath, content) {
+  const tmpPath = `${filePath}.tmp`;
+  fs.writeFileSync(tmpPath, content, "utf8");
+  fs.renameSync(tmpPath, filePath);
+}
+
+// 案件路径解析缓存：同一会话内对相同案件的重复查找无需再stat
+const casePathCache = new Map();
+
+/**
+ * 清空案件路径缓存（新建案件后调用，保证新目录可被解析到）
+ */
+function clearCasePathCache() {
+  casePathCache.clear();
+}
 
 /**
  * 获取案件路径（支持多种目录命名格式）
@@ -15,19 +207,33 @@ const glob = require("glob");
  * @returns {string|null} - 案件路径，如果找不到则返回null
  */
 function getCasePath(baseDir, casesDir, caseName) {
+  // 键需覆盖全部候选路径的输入：第三个候选由baseDir推导
+  const cacheKey = `${baseDir}|${casesDir}|${caseName}`;
+  const cached = casePathCache.get(cacheKey);
+  if (cached !== undefined) {
+    return cached;
+  }
+
   // 尝试多种可能的路径格式
   const possiblePaths = [
-    path.join(casesDir, `案件：${caseName}`), // 带"案件："前缀
+    path.join(casesDir, CASE_PREFIX + caseName), // 带"案件："前缀
     path.join(casesDir, caseName), // 无前缀
     path.join(baseDir, "案例", caseName), // 绝对路径
   ];
 
   for (const p of possiblePaths) {
-    if (fs.existsSync(p) && fs.statSync(p).isDirectory()) {
-      return p;
+    // 直接stat并捕获ENOENT，每个候选路径只需一次系统调用
+    try {
+      if (fs.statSync(p).isDirectory()) {
+        casePathCache.set(cacheKey, p);
+        return p;
+      }
+    } catch (e) {
+      // 路径不存在，继续尝试下一个候选
     }
   }
 
+  // 未命中不缓存，避免新建案件后仍返回旧的null结果
   return null;
 }
 
@@ -45,18 +251,19 @@ function listCases(casesDir) {
     return;
   }
 
-  // 查找带"案件："前缀的目录
-  const prefixedCases = glob
-    .sync(path.join(casesDir, "案件：*"))
-    .filter((p) => fs.statSync(p).isDirectory());
+  // 单次遍历目录，按是否带"案件："前缀分类（避免两次glob扫描和逐项stat）
+  const prefixedCases = [];
+  const directCases = [];
+
+  for (const entry of fs.readdirSync(casesDir, { withFileTypes: true })) {
+    if (!entry.isDirectory()) continue;
 
-  // 查找无前缀的目录（排除"案件："前缀的目录）
-  const directCases = glob
-    .sync(path.join(casesDir, "*"))
-    .filter(
-      (p) =>
-        fs.statSync(p).isDirectory() && !path.basename(p).startsWith("案件：")
-    );
+    if (entry.name.startsWith(CASE_PREFIX)) {
+      prefixedCases.push(entry.name);
+    } else {
+      directCases.push(entry.name);
+    }
+  }
 
   const caseDirs = [...prefixedCases, ...directCases];
 
@@ -66,8 +273,7 @@ function listCases(casesDir) {
   }
 
   for (const caseDir of caseDirs) {
-    const caseName = path.basename(caseDir).replace("案件：", "");
-    console.log(`- ${caseName}`);
+    console.log(`- ${stripCasePrefix(caseDir)}`);
   }
 }
 
@@ -99,7 +305,14 @@ function selectCase(baseDir, casesDir, caseName) {
 }
 
 module.exports = {
+  CASE_PREFIX,
+  stripCasePrefix,
   getCasePath,
+  clearCasePathCache,
   listCases,
   selectCase,
+  findCaseDirectory,
+  listMaterialFiles,
+  readMaterialsRecursively,
+  writeFileAtomicSync,
 };